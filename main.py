@@ -3,6 +3,11 @@ Main entry point for the Movie Database application.
 
 This module creates the storage and application instances and runs
 the movie database application.
+
+The application is pure Python and also runs under PyPy, whose JIT is
+the fastest way to run it:
+
+    pypy3 main.py
 """
 
 from movie_app import MovieApp
@@ -12,37 +17,49 @@ def main() -> None:
     """
     Main function that initializes and runs the movie application.
     """
-    # Define user storage configurations
+    # Define user storage configurations. Storage is built lazily by a
+    # factory so only the selected user's backend is ever constructed.
     users = {
-        "1": {"name": "John", "storage": StorageJson("data/john_movies.json")},
-        "2": {"name": "Sara", "storage": StorageCsv("data/sara_movies.csv")},
-        "3": {"name": "Jack", "storage": StorageJson("data/jack_movies.json")}
+        "1": {
+            "name":    "John",
+            "factory": lambda: StorageJson("data/john_movies.json")
+            },
+        "2": {
+            "name":    "Sara",
+            "factory": lambda: StorageCsv("data/sara_movies.csv")
+            },
+        "3": {
+            "name":    "Jack",
+            "factory": lambda: StorageJson("data/jack_movies.json")
+            }
         }
 
     # Display user selection menu
-    print("\n*** Movie Database - User Selection ***")
-    print("1. John (uses JSON storage)")
-    print("2. Sara (uses CSV storage)")
-    print("3. Jack (uses JSON storage)")
-    print("0. Exit")
-
-    # Get user choice
-    choice = input("\nSelect user (0-3): ").strip()
-
-    # Handle exit
-    if choice == "0":
-        print("\nGoodbye!")
-        return
-
-    # Get user configuration
-    user_config = users.get(choice)
-    if user_config:
-        print(f"\nWelcome {user_config['name']}! Loading your movies...")
-        storage = user_config["storage"]
-    else:
+    print(
+        "\n*** Movie Database - User Selection ***\n"
+        "1. John (uses JSON storage)\n"
+        "2. Sara (uses CSV storage)\n"
+        "3. Jack (uses JSON storage)\n"
+        "0. Exit"
+        )
+
+    # Get user choice, re-prompting until a valid user or exit is chosen
+    while True:
+        choice = input("\nSelect user (0-3): ").strip()
+
+        # Handle exit
+        if choice == "0":
+            print("\nGoodbye!")
+            return
+
+        # Get user configuration
+        user_config = users.get(choice)
+        if user_config:
+            break
         print("\nInvalid choice. Please try again.")
-        main()  # Restart the selection
-        return
+
+    print(f"\nWelcome {user_config['name']}! Loading your movies...")
+    storage = user_config["factory"]()
 
     # Creates movie app with the selected storage
     movie_app = MovieApp(storage)
@@ -6,52 +6,252 @@ menu display, and command execution while using a storage interface for
 data persistence.
 """
 
+import atexit
 import base64
+import functools
+import heapq
+import html
 import os
 import random
 import re
 import shutil
-import statistics as stats
 import sys
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, Optional
 
 import requests  # Add this import for API calls
 from dotenv import load_dotenv  # Add this import for environment variables
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from storage import IStorage
 
-# Load environment variables from .env file
-load_dotenv()
-
 # Constants
 EARLIEST_MOVIE_YEAR = 1888  # Year of first motion picture (Roundhay Garden)
 TITLE_DISPLAY_WIDTH = 40  # Width for centered title display
+RATING_PAGE_SIZE = 50  # Movies per page of "Movies sorted by rating"
 MIN_RATING = 0.0
 MAX_RATING = 10.0
 RATING_DECIMAL_PLACES = 1
+VALID_MENU_CHOICES = frozenset(str(choice) for choice in range(13))
+YES_ANSWERS = frozenset({"y", "yes"})
+NO_ANSWERS = frozenset({"n", "no"})
+
+# Console text, built once at import instead of on every menu loop
+TITLE_BANNER = "\n" + " My Movies Database ".center(TITLE_DISPLAY_WIDTH, "*")
+MENU_TEXT = (
+    "\n"
+    "Menu:\n"
+    "0. Exit\n"
+    "1. List movies\n"
+    "2. Add movie\n"
+    "3. Delete movie\n"
+    "4. Update movie\n"
+    "5. Stats\n"
+    "6. Random movie\n"
+    "7. Search movie\n"
+    "8. Movies sorted by rating\n"
+    "9. Generate website\n"
+    "10. Movies sorted by year\n"
+    "11. Filter movies\n"
+    "12. Bulk add movies"
+    )
 
 # API Constants
-OMDB_API_KEY = os.getenv("OMDB_API_KEY")
-if not OMDB_API_KEY:
-    print("WARNING: OMDB_API_KEY not found in environment variables!")
-    print("Please create a .env file with your API key.")
-OMDB_BASE_URL = "http://www.omdbapi.com/"
+OMDB_BASE_URL = "https://www.omdbapi.com/"
 API_TIMEOUT_SECONDS = 10  # Timeout for API requests
-REQUIRED_API_FIELDS = ["Title", "Year", "imdbRating", "Poster"]
+API_MAX_RETRIES = 3  # Retries for transient API failures
+REQUIRED_API_FIELDS = ("Title", "Year", "imdbRating", "Poster")
+REQUIRED_API_FIELD_SET = frozenset(REQUIRED_API_FIELDS)
+OMDB_NOT_FOUND_ERROR = "Movie not found!"  # The only cacheable API error
+OMDB_CACHE_SIZE = 256  # Number of title lookups memoized per session
+BULK_FETCH_WORKERS = 4  # Concurrent API requests when bulk adding movies
+YEAR_PATTERN = re.compile(r"\d{4}")  # First 4-digit year in API "Year"
+# Whole-string formats for years and ratings, checked before converting
+# instead of catching the ValueError from int() or float()
+YEAR_INPUT_PATTERN = re.compile(r"\d+")
+RATING_INPUT_PATTERN = re.compile(r"-?(?:\d+\.?\d*|\.\d+)")
+
+# Shared HTTP session: keeps the connection (and TLS session) to OMDb
+# alive between requests instead of reconnecting on every movie lookup.
+# The bulk add workers share it too: its adapter and retry
+# settings are only set here at import, the urllib3 connection pool is
+# thread-safe (sized to one connection per worker) and the cookie jar
+# locks its own updates, so concurrent get() calls only read shared state
+_SESSION = requests.Session()
+# Retries transient failures (rate limits, server errors) with backoff
+_RETRY = Retry(
+    total=API_MAX_RETRIES,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504]
+    )
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=BULK_FETCH_WORKERS,
+        max_retries=_RETRY
+        )
+    )
+atexit.register(_SESSION.close)
 
 # Website Generation Constants
 TEMPLATE_PATH = os.path.join("templates", "_static", "index_template.html")
 OUTPUT_HTML_PATH = "index.html"
 OUTPUT_CSS_PATH = "style.css"
 SOURCE_CSS_PATH = os.path.join("templates", "_static", "style.css")
+WEBSITE_WRITE_BUFFER_SIZE = 64 * 1024  # Bytes buffered per website write
+WEBSITE_TITLE = "My Movie App"
+PLACEHOLDER_PATTERN = re.compile(r"__TEMPLATE_(TITLE|MOVIE_GRID)__")
 
 # Self-contained SVG placeholder for missing posters
-PLACEHOLDER_POSTER = "data:image/svg+xml;base64," + base64.b64encode(
+PLACEHOLDER_POSTER_SVG = (
     b'''<svg xmlns="http://www.w3.org/2000/svg" width="128" height="193">
   <rect fill="#ddd" width="128" height="193"/>
   <text x="64" y="96" text-anchor="middle" fill="#777">No Poster</text>
 </svg>'''
-    ).decode()
+    )
+
+# HTML for a single movie in the website grid (values must be escaped)
+MOVIE_ITEM_TEMPLATE = """
+<li>
+    <div class="movie">
+        <img class="movie-poster" src="%(poster)s" alt="%(title)s"/>
+        <div class="movie-title">%(title)s</div>
+        <div class="movie-year">%(year)s</div>
+    </div>
+</li>
+"""
+
+# Movie titles with their casefolded titles as parallel lists
+TitleColumns = namedtuple("TitleColumns", ["titles", "folded_titles"])
+
+# Movie titles with their casefolded titles, parsed years and ratings as
+# parallel lists
+MovieColumns = namedtuple(
+    "MovieColumns",
+    ["titles", "folded_titles", "years", "ratings"]
+    )
+
+# Movie years in ascending order with the position of each movie in
+# MovieColumns, for finding a year range by bisection
+YearOrder = namedtuple("YearOrder", ["years", "positions"])
+
+# Summary statistics computed by MovieApp._compute_stats
+MovieStats = namedtuple(
+    "MovieStats",
+    [
+        "average", "median",
+        "best_titles", "best_rating",
+        "worst_titles", "worst_rating"
+        ]
+    )
+
+
+class OmdbApiError(requests.exceptions.RequestException):
+    """
+    Raised when OMDb answers with an error other than an unknown title,
+    such as an invalid API key or a reached request limit.
+    """
+
+
+def _parse_number(value, convert: Callable) -> float:
+    """
+    Converts a stored year or rating with convert (int or float). Values
+    that cannot be converted, such as "N/A", become 0 like missing ones,
+    so a single bad record cannot break sorting, filtering or stats.
+    """
+    try:
+        return convert(value)
+    except (TypeError, ValueError):
+        return convert(0)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_api_key() -> str:
+    """
+    Returns the OMDb API key. The .env file is loaded and the key looked up
+    on first use rather than at import, and the missing-key warning is
+    printed only once.
+    """
+    # Load environment variables from .env file
+    load_dotenv()
+    api_key = os.environ.get("OMDB_API_KEY")
+    if not api_key:
+        print("WARNING: OMDB_API_KEY not found in environment variables!")
+        print("Please create a .env file with your API key.")
+    return api_key
+
+
+@functools.lru_cache(maxsize=OMDB_CACHE_SIZE)
+def _request_omdb(title_key: str) -> dict:
+    """
+    Requests raw movie data for a normalized title from the OMDb API.
+    Responses are memoized per title, so repeated lookups skip the network.
+    Failed requests and OMDb errors other than "Movie not found!" raise
+    and are therefore never cached. Callers must not mutate the returned
+    dict.
+    """
+    params = {
+        "apikey": _get_api_key(),
+        "t":      title_key  # "t" parameter searches by title
+        }
+    response = _SESSION.get(
+        OMDB_BASE_URL,
+        params=params,
+        timeout=API_TIMEOUT_SECONDS
+        )
+    # Checks if request was successful
+    response.raise_for_status()
+    # Parses JSON response
+    data = response.json()
+    # Checks if OMDb reported an error that may not last, like a rate limit
+    error = data.get("Error")
+    if data.get("Response") == "False" and error != OMDB_NOT_FOUND_ERROR:
+        raise OmdbApiError(error or "Unknown API error")
+    return data
+
+
+atexit.register(_request_omdb.cache_clear)
+
+
+def _try_request_omdb(
+        title_key: str
+        ) -> Optional[requests.exceptions.RequestException]:
+    """
+    Requests a title like _request_omdb, but returns the request error
+    instead of raising it (None on success), so worker threads can hand
+    failures back to the caller.
+    """
+    try:
+        _request_omdb(title_key)
+    except requests.exceptions.RequestException as e:
+        return e
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _placeholder_poster() -> str:
+    """
+    Returns the placeholder poster as a data URI. Encoded on first use
+    only, so sessions that never generate a website skip the work.
+    """
+    encoded = base64.b64encode(PLACEHOLDER_POSTER_SVG).decode()
+    return "data:image/svg+xml;base64," + encoded
+
+
+@functools.lru_cache(maxsize=1)
+def _read_template() -> str:
+    """
+    Reads the website template. The template is static, so it is read
+    once and reused; a failed read raises and is not cached.
+    """
+    with open(TEMPLATE_PATH, "r", encoding="utf-8") as file:
+        return file.read()
 
 
 # pylint: disable=too-few-public-methods
@@ -65,45 +265,152 @@ class MovieApp:
         Initializes the MovieApp with a storage implementation.
         """
         self._storage = storage
+        # Upper bound for year input, looked up once per session
+        self._current_year = date.today().year
+        # Menu dispatch table, built once instead of on every menu choice
+        self._commands = {
+            "1":  self._command_list_movies,
+            "2":  self._command_add_movie,
+            "3":  self._command_delete_movie,
+            "4":  self._command_update_movie,
+            "5":  self._command_movie_stats,
+            "6":  self._command_random_movie,
+            "7":  self._command_search_movie,
+            "8":  self._command_sorted_by_rating,
+            "9":  self._generate_website,
+            "10": self._command_sorted_by_year,
+            "11": self._command_filter_movies,
+            "12": self._command_bulk_add_movies
+            }
+        # Movies loaded from storage, reused until the next change
+        self._movies_cache = None
+        # Casefolded title -> original title, for case-insensitive lookups
+        self._folded_index = None
+        # Titles with their casefolded titles; needs only the keys
+        self._title_columns = None
+        # Titles with their years and ratings parsed to numbers once
+        self._movie_columns = None
+        # Movie positions ordered by year; built on first filter
+        self._year_order = None
+        # (casefolded title, title, details) entries for searching; built
+        # on first search and dropped whenever the movies change
+        self._search_index = None
+        # Sorted movie lists shown by the list and sort commands, by kind
+        self._sorted_views = {}
+
+    def _get_movies(self) -> dict:
+        """
+        Returns the movies from storage, loading them only once between
+        changes instead of on every command.
+        """
+        if self._movies_cache is None:
+            self._movies_cache = self._storage.list_movies()
+        return self._movies_cache
+
+    def _get_title_columns(self) -> TitleColumns:
+        """
+        Returns the titles of the cached movies with their casefolded
+        titles as parallel lists, built once per load from the keys alone.
+        Lookups, search, the title sort and the random pick use these, so they
+        never depend on the stored years and ratings.
+        """
+        if self._title_columns is None:
+            titles = list(self._get_movies())
+            self._title_columns = TitleColumns(
+                titles=titles,
+                folded_titles=[title.casefold() for title in titles]
+                )
+        return self._title_columns
+
+    def _get_movie_columns(self) -> MovieColumns:
+        """
+        Returns the title columns together with the years and ratings of
+        the cached movies as parallel lists. Years and ratings are
+        converted to numbers once per load, on the first sort, filter or
+        stat, instead of in every one of them.
+        """
+        if self._movie_columns is None:
+            movies = self._get_movies()
+            title_columns = self._get_title_columns()
+            titles = title_columns.titles
+            self._movie_columns = MovieColumns(
+                titles=titles,
+                folded_titles=title_columns.folded_titles,
+                years=[
+                    _parse_number(movies[title].get("year", 0), int)
+                    for title in titles
+                    ],
+                ratings=[
+                    _parse_number(movies[title].get("rating", 0), float)
+                    for title in titles
+                    ]
+                )
+        return self._movie_columns
+
+    def _get_year_order(self) -> YearOrder:
+        """
+        Returns the cached movies' years in ascending order together with
+        the matching positions in the movie columns, sorting them only
+        once per load.
+        """
+        if self._year_order is None:
+            years = self._get_movie_columns().years
+            positions = sorted(range(len(years)), key=years.__getitem__)
+            self._year_order = YearOrder(
+                years=[years[position] for position in positions],
+                positions=positions
+                )
+        return self._year_order
+
+    def _invalidate_caches(self) -> None:
+        """
+        Drops the cached movies and data derived from them. Called after
+        every add, delete or update.
+        """
+        self._movies_cache = None
+        self._folded_index = None
+        self._title_columns = None
+        self._movie_columns = None
+        self._year_order = None
+        self._search_index = None
+        self._sorted_views = {}
+
+    def _get_sorted_view(self, kind: str, sort_func: Callable) -> list:
+        """
+        Returns the sorted movie list of the given kind, calling sort_func
+        to build it only once between changes instead of on every command.
+        """
+        sorted_movies = self._sorted_views.get(kind)
+        if sorted_movies is None:
+            sorted_movies = sort_func()
+            self._sorted_views[kind] = sorted_movies
+        return sorted_movies
 
     def _show_title(self) -> None:
         """
         Shows title of program.
         """
-        title = " My Movies Database "
-        print(f"\n{title.center(TITLE_DISPLAY_WIDTH, '*')}")
+        print(TITLE_BANNER)
 
     def _show_menu(self) -> None:
         """
         Shows list of available commands.
         """
-        print(
-            "\n"
-            "Menu:\n"
-            "0. Exit\n"
-            "1. List movies\n"
-            "2. Add movie\n"
-            "3. Delete movie\n"
-            "4. Update movie\n"
-            "5. Stats\n"
-            "6. Random movie\n"
-            "7. Search movie\n"
-            "8. Movies sorted by rating\n"
-            "9. Generate website\n"
-            "10. Movies sorted by year\n"
-            "11. Filter movies"
-            )
+        print(MENU_TEXT)
 
     def _command_list_movies(self) -> None:
         """
         Lists all movies in the database.
         """
-        movies = self._storage.list_movies()
+        movies = self._get_movies()
         if not self._check_movies_exist(movies):
             return
 
         # Use helper functions
-        movies_sorted = self._sort_movies_by_title(movies)
+        movies_sorted = self._get_sorted_view(
+            "title",
+            lambda: self._sort_movies_by_title(movies)
+            )
         print(f"\n{len(movies_sorted)} movie(s) in total.")
         self._print_movie_list(movies_sorted)
 
@@ -116,16 +423,6 @@ class MovieApp:
             return False
         return True
 
-    def _get_ratings_list(self, movies: dict) -> list:
-        """
-        Extracts all ratings from movies dict as a list of floats.
-        """
-        ratings = []
-        for movie_data in movies.values():
-            rating = movie_data.get("rating", 0)
-            ratings.append(float(rating))
-        return ratings
-
     def _validate_api_response(self, data: dict, title: str) -> bool:
         """
         Validates that API response contains all required fields.
@@ -136,22 +433,26 @@ class MovieApp:
             print(f'Movie "{title}" not found in OMDb API')
             return False
 
-        # Validates required fields exist
-        for field in REQUIRED_API_FIELDS:
-            if field not in data:
-                print(f"Warning: Missing {field} in API response.")
-                return False
-        return True
+        # Validates required fields exist with a single set difference;
+        # reports the first missing field in the documented order
+        if data.keys() >= REQUIRED_API_FIELD_SET:
+            return True
+        missing = REQUIRED_API_FIELD_SET - data.keys()
+        field = next(f for f in REQUIRED_API_FIELDS if f in missing)
+        print(f"Warning: Missing {field} in API response.")
+        return False
 
-    def _extract_movie_data(self, data: dict, title: str) -> dict:
+    def _extract_movie_data(self, data: dict) -> dict:
         """
-        Extracts relevant movie data from API response.
+        Extracts relevant movie data from API response. The required
+        fields are checked by _validate_api_response, so they are read
+        directly.
         """
         return {
-            "title":  data.get("Title", title),
-            "year":   data.get("Year", "N/A"),
-            "rating": data.get("imdbRating", "N/A"),
-            "poster": data.get("Poster", "")
+            "title":  data["Title"],
+            "year":   data["Year"],
+            "rating": data["imdbRating"],
+            "poster": data["Poster"]
             }
 
     def _fetch_movie_from_api(self, title: str) -> dict:
@@ -159,39 +460,43 @@ class MovieApp:
         Fetches movie data from OMDb API.
         Returns movie data dict on success, None on failure.
         """
-        # Builds the API URL with parameters
-        params = {
-            "apikey": OMDB_API_KEY,
-            "t":      title  # "t" parameter searches by title
-            }
         try:
-            # Makes the API request
-            response = requests.get(
-                OMDB_BASE_URL,
-                params=params,
-                timeout=API_TIMEOUT_SECONDS
-                )
-            # Checks if request was successful
-            response.raise_for_status()
-            # Parses JSON response
-            data = response.json()
+            # Makes the API request (or reuses a cached response);
+            # OMDb title search is case-insensitive, so normalizes the key
+            data = _request_omdb(title.strip().lower())
             # Validates response
             if not self._validate_api_response(data, title):
                 return None
             # Extracts and returns relevant data
-            return self._extract_movie_data(data, title)
-        except requests.exceptions.ConnectionError:
+            return self._extract_movie_data(data)
+        except requests.exceptions.RequestException as e:
+            self._report_request_error(e)
+            return None
+
+    def _report_request_error(self, error: Exception) -> None:
+        """
+        Prints a user-facing message for a failed OMDb request.
+        """
+        if isinstance(error, requests.exceptions.ConnectionError):
             print(
                 "Error: Could not connect to movie database. "
                 "Check your internet connection."
                 )
-            return None
-        except requests.exceptions.Timeout:
+        elif isinstance(error, requests.exceptions.Timeout):
             print("Error: Request timed out. Please try again.")
-            return None
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching movie data: {e}.")
-            return None
+        elif isinstance(error, OmdbApiError):
+            print(f"Error from movie database: {error}")
+        else:
+            print(f"Error fetching movie data: {error}.")
+
+    def _validate_new_movie_title(self, title: str) -> None:
+        """
+        Raises ValueError if a movie with this title already exists
+        (case-insensitive).
+        """
+        existing_key = self._find_movie_key(title)
+        if existing_key is not None:
+            raise ValueError(f'Movie "{title}" already exists.')
 
     def _get_and_validate_new_movie_title(self) -> str:
         """
@@ -205,12 +510,45 @@ class MovieApp:
             "Movie name cannot be empty."
             )
         # Checks if movie already exists (case-insensitive)
-        movies = self._storage.list_movies()
-        existing_key = self._find_movie_key(movies, title)
-        if existing_key is not None:
-            raise ValueError(f'Movie "{title}" already exists.')
+        self._validate_new_movie_title(title)
         return title
 
+    def _get_new_movie_from_api(self, title: str) -> tuple:
+        """
+        Fetches a movie's data from the API and returns it as a
+        (title, year, rating, poster) tuple ready to be stored.
+        Raises ValueError if the data cannot be fetched, is invalid, or
+        the movie already exists under its API title.
+        """
+        # Fetches movie data from API
+        print(f'Fetching movie data for "{title}"...')
+        movie_data = self._fetch_movie_from_api(title)
+        # Checks if API fetch was successful
+        if movie_data is None:
+            raise ValueError("Could not fetch movie data.")
+        # Extracts data from API response
+        api_title = movie_data["title"]
+        year_str = movie_data["year"]
+        rating_str = movie_data["rating"]
+        poster = movie_data["poster"]
+        # Check if the fetched movie already exists
+        self._validate_new_movie_title(api_title)
+        # Validates and converts year and rating
+        year = self._parse_year_from_api(year_str)
+        rating = self._parse_rating_from_api(rating_str)
+        return api_title, year, rating, poster
+
+    def _add_movie_from_api(self, title: str) -> None:
+        """
+        Fetches a movie's data from the API and adds it to the database.
+        Raises ValueError like _get_new_movie_from_api.
+        """
+        api_title, year, rating, poster = self._get_new_movie_from_api(title)
+        # Adds movie with API data
+        self._storage.add_movie(api_title, year, rating, poster)
+        self._invalidate_caches()
+        print(f'Movie "{api_title}" successfully added.')
+
     def _command_add_movie(self) -> None:
         """
         Adds a new movie to the database by fetching data from API.
@@ -218,47 +556,101 @@ class MovieApp:
         try:
             # Gets and validates movie title
             title = self._get_and_validate_new_movie_title()
-            # Fetches movie data from API
-            print(f'Fetching movie data for "{title}"...')
-            movie_data = self._fetch_movie_from_api(title)
-            # Checks if API fetch was successful
-            if movie_data is None:
-                raise ValueError("Could not fetch movie data.")
-            # Extracts data from API response
-            api_title = movie_data["title"]
-            year_str = movie_data["year"]
-            rating_str = movie_data["rating"]
-            poster = movie_data["poster"]
-            # Check if the fetched movie already exists
-            movies = self._storage.list_movies()
-            existing_key = self._find_movie_key(movies, api_title)
-            if existing_key is not None:
-                raise ValueError(f'Movie "{api_title}" already exists.')
-            # Validates and converts year and rating
-            year = self._parse_year_from_api(year_str)
-            rating = self._parse_rating_from_api(rating_str)
-            # Adds movie with API data
-            self._storage.add_movie(api_title, year, rating, poster)
-            print(f'Movie "{api_title}" successfully added.')
+            self._add_movie_from_api(title)
         except ValueError as e:
             print(f"Error adding movie: {e}.")
 
+    def _get_bulk_movie_titles(self) -> list:
+        """
+        Gets movie titles from user, one per line, until a blank line.
+        """
+        print("Enter movie names, one per line (blank line to finish):")
+        titles = []
+        while True:
+            title = input("> ").strip()
+            if not title:
+                return titles
+            titles.append(title)
+
+    def _prefetch_movies_from_api(self, titles: list) -> dict:
+        """
+        Requests several titles from the OMDb API concurrently to fill the
+        lookup cache. Returns the request error for each normalized title
+        that failed, so the caller can report it without requesting the
+        title again.
+        """
+        title_keys = list(dict.fromkeys(
+            title.strip().lower() for title in titles
+            ))
+        # Loads the API key before the workers start so it happens once
+        _get_api_key()
+        with ThreadPoolExecutor(max_workers=BULK_FETCH_WORKERS) as executor:
+            errors = executor.map(_try_request_omdb, title_keys)
+            return {
+                title_key: error
+                for title_key, error in zip(title_keys, errors)
+                if error is not None
+                }
+
+    def _command_bulk_add_movies(self) -> None:
+        """
+        Adds several movies at once. The API lookups run concurrently,
+        then each movie is validated in the order entered and all valid
+        movies are saved to storage in one batch.
+        """
+        titles = self._get_bulk_movie_titles()
+        if not titles:
+            print("No movie names entered.")
+            return
+        # Skips titles that already exist before hitting the network
+        new_titles = []
+        for title in titles:
+            try:
+                self._validate_new_movie_title(title)
+                new_titles.append(title)
+            except ValueError as e:
+                print(f"Error adding movie: {e}.")
+        # Fetches all titles in parallel; the lookups below hit the cache
+        failed_requests = self._prefetch_movies_from_api(new_titles)
+        new_movies = []
+        batch_titles = set()
+        for title in new_titles:
+            try:
+                # Reports a failed request instead of sending it again
+                request_error = failed_requests.get(title.strip().lower())
+                if request_error is not None:
+                    self._report_request_error(request_error)
+                    raise ValueError(
+                        f'Could not fetch movie data for "{title}"'
+                        )
+                movie = self._get_new_movie_from_api(title)
+                # Checks for a duplicate within this batch
+                folded_title = movie[0].casefold()
+                if folded_title in batch_titles:
+                    raise ValueError(f'Movie "{movie[0]}" already exists.')
+                batch_titles.add(folded_title)
+                new_movies.append(movie)
+            except ValueError as e:
+                print(f"Error adding movie: {e}.")
+        if not new_movies:
+            return
+        # Saves all fetched movies with a single storage write
+        self._storage.add_movies(new_movies)
+        self._invalidate_caches()
+        for movie in new_movies:
+            print(f'Movie "{movie[0]}" successfully added.')
+
     def _parse_year_from_api(self, year_str: str) -> int:
         """
         Parses and validates year string from API response.
         """
         if year_str == "N/A":
             raise ValueError("Movie year not available in database.")
-        try:
-            # Extracts first 4-digit year from string
-            year_match = re.search(r"\d{4}", year_str)
-            if year_match:
-                return int(year_match.group())
-            raise ValueError(f"No valid year found in: {year_str}.")
-        except ValueError as exc:
-            raise ValueError(
-                f"Invalid year format from API: {year_str}."
-                ) from exc
+        # Extracts first 4-digit year from string
+        year_match = YEAR_PATTERN.search(year_str)
+        if not year_match:
+            raise ValueError(f"Invalid year format from API: {year_str}.")
+        return int(year_match.group())
 
     def _parse_rating_from_api(self, rating_str: str) -> float:
         """
@@ -266,20 +658,18 @@ class MovieApp:
         """
         if rating_str == "N/A":
             raise ValueError("Movie rating not available in database.")
-        try:
-            rating = float(rating_str)
-            # IMDb ratings are X out of 10, matching implementation
-            return round(rating, RATING_DECIMAL_PLACES)
-        except ValueError as exc:
+        if not RATING_INPUT_PATTERN.fullmatch(rating_str):
             raise ValueError(
                 f"Invalid rating format from API: {rating_str}."
-                ) from exc
+                )
+        # IMDb ratings are X out of 10, matching implementation
+        return round(float(rating_str), RATING_DECIMAL_PLACES)
 
     def _command_delete_movie(self) -> None:
         """
         Deletes a movie from the database.
         """
-        movies = self._storage.list_movies()
+        movies = self._get_movies()
         if not self._check_movies_exist(movies):
             return
         try:
@@ -291,9 +681,10 @@ class MovieApp:
             print(f"{e}.")
             return
         # Case-insensitive search
-        existing_key = self._find_movie_key(movies, title)
+        existing_key = self._find_movie_key(title)
         if existing_key:
             self._storage.delete_movie(existing_key)
+            self._invalidate_caches()
             print(f'Movie "{title}" successfully deleted.')
         else:
             print(f'Movie "{title}" does not exist.')
@@ -302,7 +693,7 @@ class MovieApp:
         """
         Updates a movie's rating in the database.
         """
-        movies = self._storage.list_movies()
+        movies = self._get_movies()
         if not self._check_movies_exist(movies):
             return
         try:
@@ -311,7 +702,7 @@ class MovieApp:
                 "Movie name cannot be empty."
                 )
             # Checks if movie exists
-            existing_key = self._find_movie_key(movies, title)
+            existing_key = self._find_movie_key(title)
             if existing_key is None:
                 raise ValueError(f'Movie "{title}" does not exist.')
             # Gets new rating
@@ -320,8 +711,13 @@ class MovieApp:
                 "Rating cannot be empty."
                 )
             rating = self._validate_rating(rating_str)
+            # Skips the storage write if the rating is unchanged
+            if movies[existing_key].get("rating") == rating:
+                print(f'Movie "{title}" already has rating {rating}.')
+                return
             # Updates movie
             self._storage.update_movie(existing_key, rating)
+            self._invalidate_caches()
             print(f'Movie "{title}" successfully updated.')
         except ValueError as e:
             print(f"Error updating movie: {e}.")
@@ -330,39 +726,32 @@ class MovieApp:
         """
         Shows statistics for all movies in database.
         """
-        movies = self._storage.list_movies()
+        movies = self._get_movies()
         if not self._check_movies_exist(movies):
             return
-        # Calculate average rating
-        avg_rating = self._calculate_average_rating(movies)
-        if avg_rating is not None:
-            print(f"\nAverage rating: {avg_rating:.1f}")
-        # Calculate median rating
-        median_rating = self._calculate_median_rating(movies)
-        if median_rating is not None:
-            print(f"Median rating: {median_rating:.1f}")
-        # Find best- and worst-rated movies
-        best_movies, best_rating = self._find_best_worst_movies(
-            movies,
-            "best"
+        # Computes all statistics in one pass over the movies
+        movie_stats = self._compute_stats()
+        print(f"\nAverage rating: {movie_stats.average:.1f}")
+        print(f"Median rating: {movie_stats.median:.1f}")
+        print(
+            f"Best movie(s): {', '.join(movie_stats.best_titles)}, "
+            f"{movie_stats.best_rating}"
             )
-        if best_movies:
-            print(f"Best movie(s): {', '.join(best_movies)}, {best_rating}")
-        worst_movies, worst_rating = self._find_best_worst_movies(
-            movies, "worst"
+        print(
+            f"Worst movie(s): {', '.join(movie_stats.worst_titles)}, "
+            f"{movie_stats.worst_rating}"
             )
-        if worst_movies:
-            print(f"Worst movie(s): {', '.join(worst_movies)}, {worst_rating}")
 
     def _command_random_movie(self) -> None:
         """
         Suggests a random movie from the database.
         """
-        movies = self._storage.list_movies()
+        movies = self._get_movies()
         if not self._check_movies_exist(movies):
             return
-        # Picks random movie
-        random_title = random.choice(list(movies.keys()))
+        # Picks random movie by position in the cached title list
+        titles = self._get_title_columns().titles
+        random_title = titles[random.randrange(len(titles))]
         movie_data = movies[random_title]
         rating = movie_data.get("rating", "N/A")
         print(f"\nYour movie for tonight: {random_title}, it's rated {rating}")
@@ -371,7 +760,7 @@ class MovieApp:
         """
         Searches for movies containing a given string.
         """
-        movies = self._storage.list_movies()
+        movies = self._get_movies()
         if not self._check_movies_exist(movies):
             return
         try:
@@ -379,38 +768,71 @@ class MovieApp:
                 "Enter part of movie name: ",
                 "Search term cannot be empty."
                 )
-            search_term = search_input.lower()
+            search_term = search_input.casefold()
         except ValueError as e:
             print(f"{e}.")
             return
-        # Finds matching movies
-        found_movies = []
-        for title, details in movies.items():
-            if search_term in title.lower():
-                found_movies.append((title, details))
+        # Finds matching movies; titles are casefolded once per load,
+        # not once per search
+        if self._search_index is None:
+            columns = self._get_title_columns()
+            self._search_index = [
+                (folded_title, title, movies[title])
+                for folded_title, title in zip(
+                    columns.folded_titles, columns.titles
+                    )
+                ]
+        found_movies = [
+            entry for entry in self._search_index if search_term in entry[0]
+            ]
         if not found_movies:
             print(f'No movie found with "{search_term}".')
             return
-        # Sorts and displays results using helper
-        found_movies.sort(key=lambda x: x[0].lower())
-        self._print_movie_list(found_movies)
+        # Sorts by the already casefolded title and displays results
+        found_movies.sort(key=itemgetter(0))
+        self._print_movie_list(
+            [(title, details) for _, title, details in found_movies]
+            )
 
     def _command_sorted_by_rating(self) -> None:
         """
-        Shows movies sorted by rating (highest first).
+        Shows movies sorted by rating (highest first), one page at a
+        time. The first page is selected with a heap; the full sort is
+        only done if the user asks for more.
         """
-        movies = self._storage.list_movies()
+        movies = self._get_movies()
         if not self._check_movies_exist(movies):
             return
-        # Uses helper function
-        sorted_movies = self._sort_movies_by_rating(movies, descending=True)
-        self._print_movie_list(sorted_movies)
+        # Uses helper function; only the top-rated page is selected
+        sorted_movies = self._get_sorted_view(
+            "rating_first_page",
+            lambda: self._sort_movies_by_rating(
+                movies,
+                descending=True,
+                limit=RATING_PAGE_SIZE
+                )
+            )
+        shown = 0
+        while True:
+            page_end = shown + RATING_PAGE_SIZE
+            self._print_movie_list(sorted_movies[shown:page_end])
+            shown = min(page_end, len(movies))
+            if shown >= len(movies):
+                return
+            print(f"\nShowing the top {shown} of {len(movies)} movies.")
+            if not self._get_yes_no_input("Show more? (Y/N): "):
+                return
+            # Sorts everything once the first page is not enough
+            sorted_movies = self._get_sorted_view(
+                "rating",
+                lambda: self._sort_movies_by_rating(movies, descending=True)
+                )
 
     def _command_sorted_by_year(self) -> None:
         """
         Shows movies sorted by year.
         """
-        movies = self._storage.list_movies()
+        movies = self._get_movies()
         if not self._check_movies_exist(movies):
             return
         # Uses helper function for yes/no input
@@ -418,9 +840,12 @@ class MovieApp:
             "Do you want the latest movies first? (Y/N): "
             )
         # Uses helper function for sorting
-        sorted_movies = self._sort_movies_by_year_and_rating(
-            movies,
-            descending=descending
+        sorted_movies = self._get_sorted_view(
+            "year_desc" if descending else "year_asc",
+            lambda: self._sort_movies_by_year_and_rating(
+                movies,
+                descending=descending
+                )
             )
         self._print_movie_list(sorted_movies)
 
@@ -443,7 +868,7 @@ class MovieApp:
         """
         Filters movies based on user criteria.
         """
-        movies = self._storage.list_movies()
+        movies = self._get_movies()
         if not self._check_movies_exist(movies):
             return
         try:
@@ -483,20 +908,21 @@ class MovieApp:
             return  # Error already printed
 
         # Step 2: Get movies
-        movies = self._storage.list_movies()
+        movies = self._get_movies()
 
-        # Step 3: Create HTML content
-        movie_grid = self._build_movie_grid_html(movies)
+        # Step 3: Split template around the movie grid
+        try:
+            head, tail = self._split_template(template)
+        except ValueError as e:
+            print(f"Error generating website: {e}.")
+            return
 
-        # Step 4: Generate final HTML
-        final_html = self._substitute_template_placeholders(
-            template, movie_grid
+        # Step 4: Stream website to file, one movie item at a time
+        self._write_website_file(
+            head, self._iter_movie_grid_html(movies), tail
             )
 
-        # Step 5: Save website
-        self._write_website_file(final_html)
-
-        # Step 6: Copy CSS
+        # Step 5: Copy CSS
         self._copy_style_file()
 
     def _load_html_template(self) -> str:
@@ -504,9 +930,7 @@ class MovieApp:
         Reads the HTML template file.
         """
         try:
-            with open(TEMPLATE_PATH, "r", encoding="utf-8") as file:
-                content = file.read()
-            return content
+            return _read_template()
         except FileNotFoundError:
             print(f"Error: Template file not found at {TEMPLATE_PATH}")
             print("Create the folders: templates/_static/")
@@ -515,21 +939,21 @@ class MovieApp:
             print(f"Error reading template: {e}")
             return None
 
-    def _build_movie_grid_html(self, movies: dict) -> str:
+    def _iter_movie_grid_html(self, movies: dict) -> Iterator[str]:
         """
-        Creates HTML for the movie grid.
+        Yields the HTML for the movie grid piece by piece, so the grid is
+        never built as one large string.
         """
         if not movies:
-            # Returns message for empty collection
-            return "<li>No movies in collection. Add movies first!</li>"
-
-        # Builds HTML for each movie
-        movie_items = []
-        for title, details in movies.items():
-            html_item = self._create_movie_item_html(title, details)
-            movie_items.append(html_item)
+            # Yields message for empty collection
+            yield "<li>No movies in collection. Add movies first!</li>"
+            return
 
-        return "\n".join(movie_items)
+        # Yields HTML for each movie, newline-separated
+        for index, (title, details) in enumerate(movies.items()):
+            if index:
+                yield "\n"
+            yield self._create_movie_item_html(title, details)
 
     def _create_movie_item_html(self, title: str, details: dict) -> str:
         """
@@ -541,39 +965,63 @@ class MovieApp:
 
         # Handles missing poster
         if not poster_url or poster_url == "N/A":
-            poster_url = PLACEHOLDER_POSTER
+            poster_url = _placeholder_poster()
+
+        # Escapes each value once and fills the shared item template
+        escaped_title = html.escape(title)
+        return MOVIE_ITEM_TEMPLATE % {
+            "poster": html.escape(poster_url),
+            "title":  escaped_title,
+            "year":   html.escape(str(year))
+            }
 
-        # Builds HTML string
-        html = f"""
-<li>
-    <div class="movie">
-        <img class="movie-poster" src="{poster_url}" alt="{title}"/>
-        <div class="movie-title">{title}</div>
-        <div class="movie-year">{year}</div>
-    </div>
-</li>
-"""
-        return html
+    def _split_template(self, template: str) -> tuple:
+        """
+        Splits the template around the movie grid placeholder and fills
+        in the title placeholder. Returns the (head, tail) HTML. Raises
+        ValueError unless the grid placeholder appears exactly once, as
+        the grid is streamed into a single place.
+        """
+        head, tail = [], []
+        current = head
+        grid_count = 0
+        # Single scan: re.split alternates literal text with the captured
+        # placeholder names, so both placeholders are handled in one pass
+        for index, part in enumerate(PLACEHOLDER_PATTERN.split(template)):
+            if index % 2 == 0:
+                current.append(part)
+            elif part == "TITLE":
+                current.append(WEBSITE_TITLE)
+            else:  # MOVIE_GRID: everything after it belongs to the tail
+                current = tail
+                grid_count += 1
+        if grid_count != 1:
+            raise ValueError(
+                "Template must contain the movie grid placeholder exactly "
+                f"once, found {grid_count}"
+                )
+        return "".join(head), "".join(tail)
 
-    def _substitute_template_placeholders(
+    def _write_website_file(
             self,
-            template: str,
-            movie_grid: str
-            ) -> str:
-        """
-        Replaces placeholders in template with actual content.
+            head: str,
+            movie_grid: Iterable[str],
+            tail: str
+            ) -> None:
         """
-        html = template.replace("__TEMPLATE_TITLE__", "My Movie App")
-        html = html.replace("__TEMPLATE_MOVIE_GRID__", movie_grid)
-        return html
-
-    def _write_website_file(self, html_content: str) -> None:
-        """
-        Saves the generated HTML to a file.
+        Streams the generated HTML to a file: the template head, each
+        chunk of the movie grid as it is produced, then the template tail.
         """
         try:
-            with open(OUTPUT_HTML_PATH, "w", encoding="utf-8") as file:
-                file.write(html_content)
+            with open(
+                    OUTPUT_HTML_PATH, "w",
+                    encoding="utf-8",
+                    buffering=WEBSITE_WRITE_BUFFER_SIZE
+                    ) as file:
+                file.write(head)
+                for chunk in movie_grid:
+                    file.write(chunk)
+                file.write(tail)
             print("Website was generated successfully.")
         except IOError as e:
             print(f"Error saving website: {e}")
@@ -583,7 +1031,8 @@ class MovieApp:
         Copies CSS file to output directory.
         """
         try:
-            shutil.copy(SOURCE_CSS_PATH, OUTPUT_CSS_PATH)
+            # copyfile skips copying permission bits (no extra chmod)
+            shutil.copyfile(SOURCE_CSS_PATH, OUTPUT_CSS_PATH)
         except FileNotFoundError:
             # CSS is optional, website works without it
             pass
@@ -591,47 +1040,53 @@ class MovieApp:
             # Non-critical error, ignore silently
             pass
 
-    def _find_movie_key(self, movies: dict, search_title: str) -> str:
+    def _get_folded_index(self) -> dict:
         """
-        Performs case-insensitive search for movie title.
+        Returns the casefolded title -> original title index of the cached
+        movies, building it once per load of the movies from the already
+        casefolded titles.
         """
-        if not search_title:
-            return None
-        search_title_lower = search_title.lower()
-        for original_key in movies.keys():
-            if original_key.lower() == search_title_lower:
-                return original_key
-        return None
+        if self._folded_index is None:
+            columns = self._get_title_columns()
+            self._folded_index = dict(
+                zip(columns.folded_titles, columns.titles)
+                )
+        return self._folded_index
+
+    def _find_movie_key(self, search_title: str) -> str:
+        """
+        Performs case-insensitive search for movie title with a single
+        lookup in the casefolded title index. Callers reject empty titles
+        when reading them from the user.
+        """
+        return self._get_folded_index().get(search_title.casefold())
 
     def _validate_year(self, year_str: str) -> int:
         """
         Validates year input.
         """
-        try:
-            year = int(year_str)
-            current_year = date.today().year
-            if not EARLIEST_MOVIE_YEAR <= year <= current_year:
-                raise ValueError(
-                    f"Year must be between {EARLIEST_MOVIE_YEAR} and "
-                    f"{current_year}"
-                    )
-            return year
-        except ValueError as exc:
-            raise ValueError("Invalid year format") from exc
+        if not YEAR_INPUT_PATTERN.fullmatch(year_str):
+            raise ValueError("Invalid year format")
+        year = int(year_str)
+        if not EARLIEST_MOVIE_YEAR <= year <= self._current_year:
+            raise ValueError(
+                f"Year must be between {EARLIEST_MOVIE_YEAR} and "
+                f"{self._current_year}"
+                )
+        return year
 
     def _validate_rating(self, rating_str: str) -> float:
         """
         Validates rating input.
         """
-        try:
-            rating = float(rating_str)
-            if not MIN_RATING <= rating <= MAX_RATING:
-                raise ValueError(
-                    f"Rating must be between {MIN_RATING} and {MAX_RATING}"
-                    )
-            return round(rating, RATING_DECIMAL_PLACES)
-        except ValueError as exc:
-            raise ValueError("Invalid rating format") from exc
+        if not RATING_INPUT_PATTERN.fullmatch(rating_str):
+            raise ValueError("Invalid rating format")
+        rating = float(rating_str)
+        if not MIN_RATING <= rating <= MAX_RATING:
+            raise ValueError(
+                f"Rating must be between {MIN_RATING} and {MAX_RATING}"
+                )
+        return round(rating, RATING_DECIMAL_PLACES)
 
     def _get_non_empty_input(
             self,
@@ -654,46 +1109,61 @@ class MovieApp:
         """
         while True:
             response = input(prompt).strip().lower()
-            if response in ["y", "yes"]:
+            if response in YES_ANSWERS:
                 return True
-            if response in ["n", "no"]:
+            if response in NO_ANSWERS:
                 return False
             print("Please enter Y or N")
 
-    def _format_movie_line(self, title: str, year: int, rating: float) -> str:
+    def _print_movie_list(self, movies: Iterable[tuple]) -> None:
         """
-        Formats a movie line for consistent display.
+        Prints a formatted list of movies as "Title (year): rating" lines
+        with a single write instead of one print call per movie. The line
+        is formatted inline to keep per-movie overhead in the loop low.
+        Accepts any iterable of (title, details) pairs; generators are
+        assumed to be non-empty.
         """
-        return f"{title} ({year}): {rating}"
-
-    def _print_movie_list(self, movies: list) -> None:
-        """
-        Prints a formatted list of movies.
-        """
-        for title, details in movies:
-            year = details.get("year", "N/A")
-            rating = details.get("rating", "N/A")
-            print(self._format_movie_line(title, year, rating))
+        if not movies:
+            return
+        print("\n".join([
+            f'{title} ({details.get("year", "N/A")}): '
+            f'{details.get("rating", "N/A")}'
+            for title, details in movies
+            ]))
 
     def _sort_movies_by_title(self, movies: dict) -> list:
         """
-        Sorts movies alphabetically by title.
+        Sorts movies alphabetically by title, using the casefolded titles
+        cached alongside the movies as sort keys.
         """
-        return sorted(movies.items(), key=lambda item: item[0].lower())
+        columns = self._get_title_columns()
+        decorated = sorted(
+            zip(columns.folded_titles, columns.titles), key=itemgetter(0)
+            )
+        return [(title, movies[title]) for _, title in decorated]
 
     def _sort_movies_by_rating(
             self,
             movies: dict,
-            descending: bool = True
+            descending: bool = True,
+            limit: int = None
             ) -> list:
         """
-        Sorts movies by rating.
+        Sorts movies by rating. Decorates each title with its pre-parsed
+        rating (decorate-sort-undecorate) and compares via a C-level
+        itemgetter. With a limit, only the first limit movies are
+        selected, using a heap instead of a full sort.
         """
-        return sorted(
-            movies.items(),
-            key=lambda x: float(x[1].get("rating", 0)),
-            reverse=descending
-            )
+        columns = self._get_movie_columns()
+        decorated = zip(columns.ratings, columns.titles)
+        if limit is not None and limit < len(columns.titles):
+            select = heapq.nlargest if descending else heapq.nsmallest
+            decorated = select(limit, decorated, key=itemgetter(0))
+        else:
+            decorated = sorted(
+                decorated, key=itemgetter(0), reverse=descending
+                )
+        return [(title, movies[title]) for _, title in decorated]
 
     def _sort_movies_by_year_and_rating(
             self,
@@ -701,123 +1171,114 @@ class MovieApp:
             descending: bool = True
             ) -> list:
         """
-        Sorts movies by year, then by rating.
-        """
-        return sorted(
-            movies.items(),
-            key=lambda x: (int(x[1].get("year", 0)),
-                           float(x[1].get("rating", 0))),
-            reverse=descending
+        Sorts movies by year, then by rating. Uses the same
+        decorate-sort-undecorate pattern as _sort_movies_by_rating.
+        """
+        columns = self._get_movie_columns()
+        decorated = list(zip(columns.years, columns.ratings, columns.titles))
+        decorated.sort(key=itemgetter(0, 1), reverse=descending)
+        return [(title, movies[title]) for _, _, title in decorated]
+
+    def _compute_stats(self) -> MovieStats:
+        """
+        Computes average, median, best and worst ratings of the cached
+        movies from a single sort of their pre-parsed ratings.
+        """
+        columns = self._get_movie_columns()
+        count = len(columns.ratings)
+        # One sort of (rating, position) pairs serves median, best and
+        # worst; positions keep tied titles in their original order
+        order = sorted(zip(columns.ratings, range(count)))
+        worst_rating = order[0][0]
+        best_rating = order[-1][0]
+        # Ties sit next to each other at both ends of the sorted pairs
+        worst_end = bisect_right(order, (worst_rating, count))
+        best_start = bisect_left(order, (best_rating, -1))
+        # Plain float arithmetic; statistics.mean/median go through exact
+        # Fraction sums that one-decimal ratings do not need
+        middle = count // 2
+        if count % 2:
+            median = order[middle][0]
+        else:
+            median = (order[middle - 1][0] + order[middle][0]) / 2
+        return MovieStats(
+            average=sum(columns.ratings) / count,
+            median=median,
+            best_titles=[
+                columns.titles[position]
+                for _, position in order[best_start:]
+                ],
+            best_rating=best_rating,
+            worst_titles=[
+                columns.titles[position]
+                for _, position in order[:worst_end]
+                ],
+            worst_rating=worst_rating
             )
 
-    def _calculate_average_rating(self, movies: dict) -> float:
-        """
-        Calculates average rating of all movies.
-        """
-        if not movies:
-            return None
-
-        ratings = self._get_ratings_list(movies)
-        return stats.mean(ratings)
-
-    def _calculate_median_rating(self, movies: dict) -> float:
-        """
-        Calculates median rating of all movies.
-        """
-        if not movies:
-            return None
-
-        ratings = self._get_ratings_list(movies)
-        return stats.median(ratings)
-
-    def _find_best_worst_movies(self, movies: dict, rating_type: str) -> tuple:
-        """
-        Finds movies with best or worst ratings.
-        """
-        if not movies:
-            # [] = Empty list (no movies found), None = No rating -> no movies
-            return [], None
-
-        # Gets all ratings
-        ratings = self._get_ratings_list(movies)
-        # Finds target rating
-        if rating_type == "best":
-            target_rating = max(ratings)
-        else:  # worst
-            target_rating = min(ratings)
-        # Finds all movies with target rating
-        matching_movies = []
-        for title, movie_data in movies.items():
-            if float(movie_data.get("rating", 0)) == target_rating:
-                matching_movies.append(title)
-        return matching_movies, target_rating
-
     def _filter_movies_by_criteria(
             self,
             movies: dict,
-            min_rating: float,
-            start_year: int,
-            end_year: int
-            ) -> list:
-        """
-        Filters movies based on rating and year criteria.
-        """
-        filtered_movies = []
-        for title, details in movies.items():
-            year = int(details.get("year", 0))
-            rating = float(details.get("rating", 0))
-            # Checks all criteria
-            rating_ok = (min_rating is None or rating >= min_rating)
-            start_year_ok = (start_year is None or year >= start_year)
-            end_year_ok = (end_year is None or year <= end_year)
-            if rating_ok and start_year_ok and end_year_ok:
-                filtered_movies.append((title, details))
-        return filtered_movies
-
-    def _display_filtered_results(self, filtered_movies: list) -> None:
+            min_rating: Optional[float],
+            start_year: Optional[int],
+            end_year: Optional[int]
+            ) -> Iterator[tuple]:
+        """
+        Filters movies based on rating and year criteria, using the
+        pre-parsed years and ratings of the cached movies. The year range
+        is located by bisection in the year-ordered positions, so only
+        movies inside it are checked for rating. Matches are yielded
+        lazily, with their casefolded title as sort key, so only they get
+        materialized by the caller.
+        """
+        columns = self._get_movie_columns()
+        year_order = self._get_year_order()
+        # Finds the slice of movies within the year range
+        start = 0
+        end = len(year_order.years)
+        if start_year is not None:
+            start = bisect_left(year_order.years, start_year)
+        if end_year is not None:
+            end = bisect_right(year_order.years, end_year)
+        for position in year_order.positions[start:end]:
+            # Checks the remaining criterion
+            if min_rating is None or columns.ratings[position] >= min_rating:
+                title = columns.titles[position]
+                yield columns.folded_titles[position], title, movies[title]
+
+    def _display_filtered_results(
+            self,
+            filtered_movies: Iterable[tuple]
+            ) -> None:
         """
         Displays filtered movie results.
         """
         print("\nFiltered movies:")
+        # Sorts by the already casefolded title for consistent display
+        filtered_movies = sorted(filtered_movies, key=itemgetter(0))
         if not filtered_movies:
             print("No movies found matching criteria.")
             return
-
-        # Sorts by title for consistent display
-        filtered_movies.sort(key=lambda x: x[0].lower())
-        self._print_movie_list(filtered_movies)
+        # Streams the sorted matches straight into the printer
+        self._print_movie_list(
+            (title, details) for _, title, details in filtered_movies
+            )
 
     def _get_user_choice(self) -> str:
         """
         Gets and validates user menu choice.
         """
-        valid_choices = [
-            "0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"
-            ]
         while True:
-            choice = input("\nEnter choice (0-11): ").strip()
-            if choice in valid_choices:
+            choice = input("\nEnter choice (0-12): ").strip()
+            if choice in VALID_MENU_CHOICES:
                 return choice
-            print("Invalid choice. Please enter 0-11.")
+            print("Invalid choice. Please enter 0-12.")
 
     def _execute_command(self, choice: str) -> None:
         """
         Executes the command based on user choice.
         """
-        commands = {
-            "1":  self._command_list_movies,
-            "2":  self._command_add_movie,
-            "3":  self._command_delete_movie,
-            "4":  self._command_update_movie,
-            "5":  self._command_movie_stats,
-            "6":  self._command_random_movie,
-            "7":  self._command_search_movie,
-            "8":  self._command_sorted_by_rating,
-            "9":  self._generate_website,
-            "10": self._command_sorted_by_year,
-            "11": self._command_filter_movies
-            }
-        command = commands.get(choice)
+        command = self._commands.get(choice)
         if command:
             command()
 
@@ -40,6 +40,18 @@ class IStorage(ABC):
         valid data.
         """
 
+    def add_movies(self, movies: list) -> None:
+        """
+        Adds several movies to the movies database. Each movie is a
+        (title, year, rating, poster) tuple. Like add_movie, the function
+        does not validate the input.
+
+        The default adds the movies one by one; implementations override
+        it to save all of them in a single write.
+        """
+        for title, year, rating, poster in movies:
+            self.add_movie(title, year, rating, poster)
+
     @abstractmethod
     def delete_movie(self, title: str) -> None:
         """
@@ -7,10 +7,13 @@ using CSV files for data persistence.
 
 import csv
 import os
+from typing import Callable
 
 from .istorage import IStorage
 from .storage_utils import ensure_directory_exists
 
+CSV_BUFFER_SIZE = 64 * 1024  # Bytes per read/write system call
+
 
 class StorageCsv(IStorage):
     """
@@ -25,46 +28,70 @@ class StorageCsv(IStorage):
         Initializes the storage with a specific CSV file path.
         """
         self._file_path = file_path
+        # Set once the directory is known to exist, so later writes skip
+        # creating it again
+        self._directory_ready = False
 
     def _ensure_file_exists(self) -> None:
         """
         Creates CSV file with headers if it does not exist.
         Called lazily only when needed.
         """
-        ensure_directory_exists(self._file_path)
+        if not self._directory_ready:
+            self._directory_ready = ensure_directory_exists(self._file_path)
 
 
     def list_movies(self) -> dict:
         """
         Returns a dictionary of dictionaries that contains the movies
         information in the database.
+
+        Rows are read with csv.reader and unpacked by column position,
+        so no intermediate dict is built per row, and the file is read
+        in large chunks.
         """
         movies = {}
         # Checks if file exists
         if not os.path.exists(self._file_path):
             return movies
         try:
-            with open(self._file_path, "r", encoding="utf-8") as file:
-                reader = csv.DictReader(file)
+            with open(
+                    self._file_path,
+                    "r",
+                    encoding="utf-8",
+                    newline="",
+                    buffering=CSV_BUFFER_SIZE
+                    ) as file:
+                reader = csv.reader(file)
+                # Locates the columns by the header row
+                header = next(reader, None)
+                if header is None:
+                    return movies
+                title_index = header.index("title")
+                year_index = header.index("year")
+                rating_index = header.index("rating")
+                poster_index = header.index("poster")
                 # Converts each CSV row to our dictionary format
                 for row in reader:
+                    if len(row) < len(header):
+                        if not row:
+                            continue  # Skips blank lines like DictReader
+                        # Pads short rows, as DictReader fills them in
+                        row += [""] * (len(header) - len(row))
+                    year = row[year_index]
+                    rating = row[rating_index]
                     # Uses title as the key
-                    title = row["title"]
-                    # Creates the movie data dictionary
                     # Using 0 for missing years to distinguish from actuals
                     # MovieApp will display missing values as "N/A" to users
-                    movie_data = {
-                        "year":   int(row["year"]) if row["year"] else 0,
-                        "rating": (float(row["rating"])
-                                   if row["rating"] else 0.0),
-                        "poster": row["poster"]
+                    movies[row[title_index]] = {
+                        "year":   int(year) if year else 0,
+                        "rating": float(rating) if rating else 0.0,
+                        "poster": row[poster_index]
                         }
-                    # Adds to movies dictionary
-                    movies[title] = movie_data
         except FileNotFoundError:
             # File does not exist, returns empty dict
             return movies
-        except (csv.Error, ValueError, KeyError) as e:
+        except (csv.Error, ValueError, IndexError) as e:
             print(f"Error reading CSV file: {e}")
             return movies
         return movies
@@ -79,9 +106,19 @@ class StorageCsv(IStorage):
         """
         Adds a movie to the movies database.
         """
-        # Check if file exists and is empty (needs headers)
-        file_exists = os.path.exists(self._file_path)
-        file_empty = not file_exists or os.path.getsize(self._file_path) == 0
+        self.add_movies([(title, year, rating, poster)])
+
+    def add_movies(self, movies: list) -> None:
+        """
+        Adds several (title, year, rating, poster) movies to the movies
+        database, appending all rows with one open and one writerows.
+        Rows follow the column order of the file's existing header.
+        """
+        # Check if file exists and is empty (needs headers) with one stat
+        try:
+            file_empty = os.path.getsize(self._file_path) == 0
+        except OSError:
+            file_empty = True
 
         # Ensures directory exists
         self._ensure_file_exists()
@@ -97,80 +134,108 @@ class StorageCsv(IStorage):
                 # Write headers if file is new or empty
                 if file_empty:
                     writer.writerow(self.FIELDNAMES)
-                # Writes the movie data as a new row
-                writer.writerow([title, year, rating, poster])
-        except OSError as e:
+                else:
+                    movies = self._order_rows(movies)
+                # Writes the movie data as new rows
+                writer.writerows(movies)
+        except (csv.Error, OSError) as e:
             print(f"Error adding movie to CSV: {e}")
 
-    def delete_movie(self, title: str) -> None:
+    def _order_rows(self, movies: list) -> list:
         """
-        Deletes a movie from the movies database.
+        Reorders FIELDNAMES-ordered rows to match the header of the
+        existing file. Columns the file does not know are dropped and
+        columns FIELDNAMES does not know are left empty.
+        """
+        with open(self._file_path, "r", newline="", encoding="utf-8") as file:
+            header = next(csv.reader(file), self.FIELDNAMES)
+        if header == self.FIELDNAMES:
+            return movies
+        positions = [
+            self.FIELDNAMES.index(name) if name in self.FIELDNAMES else None
+            for name in header
+            ]
+        return [
+            [movie[i] if i is not None else "" for i in positions]
+            for movie in movies
+            ]
+
+    def _rewrite_movie_row(self, title: str, transform: Callable) -> None:
+        """
+        Rewrites the CSV file in a single streaming pass. Each row is
+        copied to a temporary file, except the row of the given title,
+        which is passed through transform together with the file's
+        header row and dropped if transform returns None. Columns are
+        located by the header, like list_movies does, and short rows are
+        padded to the header's width. The original file is only replaced
+        if the movie was found. Raises ValueError if the header has no
+        title column.
         """
-        # Reads all movies except the one to delete
-        movies_to_keep = []
+        temp_path = self._file_path + ".tmp"
         movie_found = False
         try:
-            # Reads existing movies
-            with open(self._file_path, "r", encoding="utf-8") as file:
-                reader = csv.DictReader(file)
+            with open(
+                    self._file_path, "r",
+                    newline="",
+                    encoding="utf-8",
+                    buffering=CSV_BUFFER_SIZE
+                    ) as source, open(
+                    temp_path, "w",
+                    newline="",
+                    encoding="utf-8",
+                    buffering=CSV_BUFFER_SIZE
+                    ) as target:
+                reader = csv.reader(source)
+                writer = csv.writer(target)
+                # Copies the header row (or writes one for an empty file)
+                header = next(reader, self.FIELDNAMES)
+                writer.writerow(header)
+                title_index = header.index("title")
                 for row in reader:
-                    if row["title"] != title:
-                        movies_to_keep.append(row)
-                    else:
+                    if len(row) < len(header):
+                        if not row:
+                            continue  # Skips blank lines like list_movies
+                        row += [""] * (len(header) - len(row))
+                    if row[title_index] == title:
                         movie_found = True
-            # Only rewrites if movie was found
+                        row = transform(row, header)
+                        if row is None:
+                            continue
+                    writer.writerow(row)
+            # Atomically swaps in the rewritten file
             if movie_found:
-                # Rewrites the file without the deleted movie
-                with open(
-                        self._file_path, "w",
-                        newline="",
-                        encoding="utf-8"
-                        ) as file:
-                    writer = csv.DictWriter(
-                        file,
-                        fieldnames=self.FIELDNAMES
-                        )
-                    # Writes header
-                    writer.writeheader()
-                    # Writes remaining movies
-                    writer.writerows(movies_to_keep)
+                os.replace(temp_path, self._file_path)
+        finally:
+            # Discards the temporary file if it was not swapped in
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def delete_movie(self, title: str) -> None:
+        """
+        Deletes a movie from the movies database.
+        """
+        try:
+            # Drops the movie's row while streaming the file
+            self._rewrite_movie_row(title, lambda row, header: None)
         except FileNotFoundError:
             # File does not exist, nothing to delete
             pass
-        except (csv.Error, OSError) as e:
+        except (csv.Error, OSError, ValueError) as e:
             print(f"Error deleting movie from CSV: {e}")
 
     def update_movie(self, title: str, rating: float) -> None:
         """
         Updates a movie from the movies database.
         """
-        movies = []
-        movie_found = False
+        def update_rating(row: list, header: list) -> list:
+            # Updates only the rating column
+            row[header.index("rating")] = str(rating)
+            return row
+
         try:
-            # Reads all movies
-            with open(self._file_path, "r", encoding="utf-8") as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row["title"] == title:
-                        # Updates the rating
-                        row["rating"] = str(rating)
-                        movie_found = True
-                    movies.append(row)
-            # Only rewrites if movie was found
-            if movie_found:
-                # Rewrites the file with updated data
-                with open(
-                        self._file_path, "w",
-                        newline="",
-                        encoding="utf-8"
-                        ) as file:
-                    writer = csv.DictWriter(file, fieldnames=self.FIELDNAMES)
-                    # Writes header
-                    writer.writeheader()
-                    # Writes all movies (including updated one)
-                    writer.writerows(movies)
+            self._rewrite_movie_row(title, update_rating)
         except FileNotFoundError:
             # File does not exist, nothing to update
             pass
-        except (csv.Error, OSError) as e:
+        except (csv.Error, OSError, ValueError) as e:
             print(f"Error updating movie in CSV: {e}")
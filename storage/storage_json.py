@@ -4,14 +4,66 @@ JSON storage implementation for movie data.
 This module provides a concrete implementation of the IStorage interface
 using JSON files for data persistence. It handles reading from and writing
 to JSON files while maintaining the required data structure.
+
+Changes are appended to a journal file next to the JSON file (one JSON
+record per line) instead of rewriting the whole file on every change. The
+journal is folded back into the JSON file when it is found on load, at
+interpreter exit, and whenever it grows past JOURNAL_COMPACT_SIZE, so the
+JSON file stays the authoritative store between sessions.
 """
 
+import atexit
+import contextlib
 import json
 import os
+import time
 
 from .istorage import IStorage
 from .storage_utils import ensure_directory_exists
 
+JOURNAL_SUFFIX = ".journal"  # Journal file is "<json file>.journal"
+JOURNAL_COMPACT_SIZE = 64 * 1024  # Journal bytes before it is compacted
+JSON_INDENT = 4  # Indentation of the saved JSON file
+
+# orjson is the fast path on CPython; the stdlib json fallback keeps the
+# storage working where orjson is unavailable or slow (e.g. PyPy). The
+# full file is always written by the stdlib json module, since orjson
+# only indents by 2 spaces and the file keeps its 4-space format.
+try:
+    import orjson
+
+    def _loads(data: bytes) -> dict:
+        """Parses JSON bytes with orjson."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN, Infinity and integers wider than 64
+            # bits, all of which the stdlib json module writes and reads
+            return json.loads(data)
+
+    def _dumps_record(record: dict) -> bytes:
+        """Serializes a journal record to one line of JSON with orjson."""
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    def _loads(data: bytes) -> dict:
+        """Parses JSON bytes with the stdlib json module."""
+        return json.loads(data)
+
+    def _dumps_record(record: dict) -> bytes:
+        """Serializes a journal record to one line of JSON with json."""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        return line.encode("utf-8")
+
+
+def _corrupt_suffix() -> str:
+    """Returns the ".corrupt.<timestamp>" suffix for files moved aside."""
+    return f".corrupt.{time.strftime('%Y%m%d-%H%M%S')}"
+
+
+def _dumps(movies: dict) -> bytes:
+    """Serializes movies to indented JSON bytes like json.dump did."""
+    return json.dumps(movies, indent=JSON_INDENT).encode("utf-8")
+
 
 class StorageJson(IStorage):
     """
@@ -23,28 +75,86 @@ class StorageJson(IStorage):
         Initializes the storage with a specific JSON file path.
         """
         self._file_path = file_path
+        self._journal_path = file_path + JOURNAL_SUFFIX
+        # Set once the directory is known to exist, so later writes skip
+        # creating it again
+        self._directory_ready = False
+        # Folds the session's journal into the JSON file on exit
+        atexit.register(self._compact_journal)
+        # Parsed movies and the (mtime, size) stamps of the JSON file and
+        # journal they were read from, so repeated calls skip re-parsing
+        # unchanged files
+        self._cache = None
+        self._stamp = None
+
+    @staticmethod
+    def _path_stamp(path: str) -> tuple:
+        """
+        Returns the (mtime in ns, size) of a file, or None if the file does
+        not exist.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _file_stamp(self) -> tuple:
+        """
+        Returns the stamps of the JSON file and its journal, or None if
+        neither exists.
+        """
+        stamp = (
+            self._path_stamp(self._file_path),
+            self._path_stamp(self._journal_path)
+            )
+        if stamp == (None, None):
+            return None
+        return stamp
 
     def list_movies(self) -> dict:
         """
         Returns a dictionary of dictionaries that
         contains the movies information in the database.
+
+        The parsed dictionary is cached until the file changes on disk,
+        so callers should treat it as read-only.
         """
         # Checks if file exists
-        if not os.path.exists(self._file_path):
+        stamp = self._file_stamp()
+        if stamp is None:
             # Returns empty dictionary if file does not exist
+            self._cache = None
             return {}
+        # Reuses the cached movies if the file is unchanged
+        if self._cache is not None and stamp == self._stamp:
+            return self._cache
         try:  # Opens and reads the JSON file
-            with open(self._file_path, "r", encoding="utf-8") as file:
-                data = json.load(file)
+            data = {}
+            if stamp[0] is not None:
+                # Parses bytes directly, skipping a separate UTF-8 decode
+                with open(self._file_path, "rb") as file:
+                    data = _loads(file.read())
             # Handles both old format {"Movies": {...}} and new format {...}
             if isinstance(data, dict) and "Movies" in data:
-                return data["Movies"]
+                data = data["Movies"]
+            # Applies changes left over from an earlier session (up to a
+            # damaged line) and folds them into the JSON file right away,
+            # so the JSON file is complete and new records start a fresh
+            # journal
+            if stamp[1] is not None:
+                self._replay_journal(data)
+                self._save_movies(data)
+                return data
+            self._cache = data
+            self._stamp = stamp
             return data
         except json.JSONDecodeError:  # If file corrupted, return empty dict
             print(
                 f"Error: Could not read {self._file_path}. "
                 f"File may be corrupted."
                 )
+            self._quarantine_corrupt_file()
             return {}
         except OSError as e:  # Handles file system errors (permission, disk)
             print(f"Error reading file: {e}")
@@ -60,10 +170,22 @@ class StorageJson(IStorage):
         """
         Adds a movie to the movies database.
         """
-        movies = self.list_movies()  # Loads current movies
-        # Adds the new movie
-        movies[title] = {"rating": rating, "year": year, "poster": poster}
-        self._save_movies(movies)  # Saves dict back to file
+        self.add_movies([(title, year, rating, poster)])
+
+    def add_movies(self, movies: list) -> None:
+        """
+        Adds several (title, year, rating, poster) movies to the movies
+        database, recording all of them with one journal write.
+        """
+        stored_movies = self.list_movies()  # Loads current movies
+        records = []
+        for title, year, rating, poster in movies:
+            # Adds the new movie
+            movie = {"rating": rating, "year": year, "poster": poster}
+            stored_movies[title] = movie
+            records.append({"op": "add", "title": title, "movie": movie})
+        # Records the changes in the journal
+        self._append_journal(stored_movies, records)
 
     def delete_movie(self, title: str) -> None:
         """
@@ -72,7 +194,10 @@ class StorageJson(IStorage):
         movies = self.list_movies()  # Loads current movies
         if title in movies:  # Checks if movie exists
             del movies[title]  # Deletes the movie
-            self._save_movies(movies)  # Saves dict back to file
+            self._append_journal(
+                movies,
+                [{"op": "delete", "title": title}]
+                )
 
     def update_movie(self, title: str, rating: float) -> None:
         """
@@ -81,27 +206,169 @@ class StorageJson(IStorage):
         movies = self.list_movies()  # Loads current movies
         if title in movies:  # Checks if movie exists
             movies[title]["rating"] = rating  # Updates only the rating
-            self._save_movies(movies)  # Saves dict back to file
+            self._append_journal(
+                movies,
+                [{"op": "update", "title": title, "rating": rating}]
+                )
+
+    def _quarantine_corrupt_file(self) -> None:
+        """
+        Moves a JSON file that could not be parsed aside, so the next save
+        does not overwrite it and later reads do not re-parse it. Its
+        journal only makes sense on top of that file, so it is moved aside
+        with it; the empty collection the caller sees is then also what
+        gets persisted.
+        """
+        suffix = _corrupt_suffix()
+        corrupt_path = self._file_path + suffix
+        try:
+            os.replace(self._file_path, corrupt_path)
+            if os.path.exists(self._journal_path):
+                os.replace(self._journal_path, self._journal_path + suffix)
+        except OSError as e:
+            print(f"Error moving corrupted file aside: {e}")
+            return
+        print(f"The corrupted file was kept as {corrupt_path}.")
+
+    def _replay_journal(self, movies: dict) -> None:
+        """
+        Applies the changes recorded in the journal to movies, up to the
+        first damaged line. A damaged last line, e.g. one cut short by a
+        crash, is dropped quietly. A damaged line with records after it
+        is reported and the journal is moved aside, so the records it
+        skipped are kept instead of being removed by the next save.
+        """
+        with open(self._journal_path, "rb") as journal:
+            lines = journal.readlines()
+        for number, line in enumerate(lines, 1):
+            if self._apply_journal_record(movies, line):
+                continue
+            # Checks if records follow the damaged line
+            if number < len(lines):
+                self._set_journal_aside(number)
+            return
+
+    @staticmethod
+    def _apply_journal_record(movies: dict, line: bytes) -> bool:
+        """
+        Applies one journal line to movies. Returns False, leaving movies
+        unchanged, if the line is unreadable or the record malformed.
+        """
+        try:
+            record = _loads(line)
+        except json.JSONDecodeError:
+            return False
+        # A record with missing or mistyped fields is treated like an
+        # unreadable line
+        try:
+            title = record["title"]
+            op = record["op"]
+            if op == "add":
+                movie = record["movie"]
+                if not isinstance(movie, dict):
+                    return False
+                movies[title] = movie
+            elif op == "delete":
+                movies.pop(title, None)
+            elif op == "update":
+                if title in movies:
+                    movies[title]["rating"] = record["rating"]
+            else:
+                return False
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def _set_journal_aside(self, number: int) -> None:
+        """
+        Moves a journal with a damaged line in the middle aside under the
+        same ".corrupt.<timestamp>" name as a corrupted JSON file, so the
+        records after that line can still be recovered by hand.
+        """
+        kept_path = self._journal_path + _corrupt_suffix()
+        try:
+            os.replace(self._journal_path, kept_path)
+        except OSError as e:
+            print(f"Error moving damaged journal aside: {e}")
+            return
+        print(
+            f"Warning: Could not replay line {number} of "
+            f"{self._journal_path}. The journal was kept as {kept_path}."
+            )
+
+    def _append_journal(self, movies: dict, records: list) -> None:
+        """
+        Appends change records to the journal with a single write, so a
+        change costs a line of output instead of rewriting the whole file.
+        Rewrites the JSON file instead once the journal has grown past
+        JOURNAL_COMPACT_SIZE.
+        """
+        self._ensure_file_exists()
+        try:
+            with open(self._journal_path, "ab") as journal:
+                journal.write(b"".join(map(_dumps_record, records)))
+                size = journal.tell()
+        except OSError as e:
+            # Drops the cache so the next read reflects the files on disk
+            self._cache = None
+            self._stamp = None
+            print(f"Error saving file: {e}")
+            return
+        if size > JOURNAL_COMPACT_SIZE:
+            self._save_movies(movies)
+        else:
+            # Keeps the cache in sync with what was just written
+            self._cache = movies
+            self._stamp = self._file_stamp()
+
+    def _compact_journal(self) -> None:
+        """
+        Rewrites the JSON file with the journaled changes and removes the
+        journal, if there is one. Registered to run at interpreter exit.
+        """
+        if os.path.exists(self._journal_path):
+            movies = self.list_movies()
+            # list_movies compacts by itself unless it used its cache
+            if os.path.exists(self._journal_path):
+                self._save_movies(movies)
 
     def _ensure_file_exists(self) -> None:
         """
         Creates JSON file with empty structure if it does not exist.
         Called lazily only when needed.
         """
-        ensure_directory_exists(self._file_path)
+        if not self._directory_ready:
+            self._directory_ready = ensure_directory_exists(self._file_path)
 
 
     def _save_movies(self, movies: dict) -> None:
         """
-        Helper method to save movies to the JSON file.
+        Helper method to save movies to the JSON file. Writes to a
+        temporary file that replaces the JSON file only once it is fully
+        on disk, so an interrupted save never leaves a truncated file.
         """
+        temp_path = self._file_path + ".tmp"
+        self._ensure_file_exists()
         try:
-            # Creates directory if it does not exist
-            directory = os.path.dirname(self._file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
             # Saves dict to file with proper formatting
-            with open(self._file_path, "w", encoding="utf-8") as file:
-                json.dump(movies, file, indent=4)
+            with open(temp_path, "wb") as file:
+                file.write(_dumps(movies))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self._file_path)
+            # The JSON file now holds every change, so the journal is done
+            if os.path.exists(self._journal_path):
+                os.remove(self._journal_path)
+            # Keeps the cache in sync with what was just written
+            self._cache = movies
+            self._stamp = self._file_stamp()
         except OSError as e:
+            # Drops the cache so the next read reflects the file on disk
+            self._cache = None
+            self._stamp = None
             print(f"Error saving file: {e}")
+        finally:
+            # Cleans up the temporary file if the save did not complete;
+            # a failed cleanup must not hide the original error
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
@@ -8,11 +8,18 @@ implementations to reduce code duplication and maintain consistency.
 import os
 
 
-def ensure_directory_exists(file_path: str) -> None:
-    """Creates directory for file if it doesn't exist."""
+def ensure_directory_exists(file_path: str) -> bool:
+    """
+    Creates directory for file if it doesn't exist. Returns True if the
+    directory exists afterwards.
+    """
     directory = os.path.dirname(file_path)
-    if directory and not os.path.exists(directory):
-        try:
-            os.makedirs(directory)
-        except OSError as e:
-            print(f"Error creating directory: {e}")
+    if not directory:
+        return True
+    try:
+        # exist_ok avoids a separate existence check before creating
+        os.makedirs(directory, exist_ok=True)
+    except OSError as e:
+        print(f"Error creating directory: {e}")
+        return False
+    return True
@@ -0,0 +1,298 @@
+"""
+Tests for the MovieApp commands and their helpers.
+"""
+
+import builtins
+import json
+
+import pytest
+import requests
+
+import movie_app
+from movie_app import MovieApp
+from storage import StorageJson
+
+# OMDb responses served by the omdb fixture, by normalized title
+OMDB_CATALOG = {
+    "jaws": {
+        "Title": "Jaws", "Year": "1975", "imdbRating": "8.1",
+        "Poster": "jaws.jpg", "Response": "True"
+        },
+    "heat": {
+        "Title": "Heat", "Year": "1995", "imdbRating": "8.3",
+        "Poster": "heat.jpg", "Response": "True"
+        }
+    }
+
+
+def make_app(tmp_path, movies) -> MovieApp:
+    """
+    Returns a MovieApp backed by a JSON file holding movies.
+    """
+    path = tmp_path / "movies.json"
+    path.write_text(json.dumps(movies), encoding="utf-8")
+    return MovieApp(StorageJson(str(path)))
+
+
+def movie(year, rating) -> dict:
+    """
+    Returns stored movie details without a poster.
+    """
+    return {"year": year, "rating": rating, "poster": ""}
+
+
+def feed_input(monkeypatch, *answers) -> None:
+    """
+    Answers the app's input() prompts with answers, in order.
+    """
+    replies = iter(answers)
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(replies))
+
+
+class FakeResponse:
+    """
+    Stands in for a requests response holding parsed JSON data.
+    """
+
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    def raise_for_status(self) -> None:
+        """
+        Accepts every response, like an HTTP 200.
+        """
+
+    def json(self) -> dict:
+        """
+        Returns the response data.
+        """
+        return self._data
+
+
+@pytest.fixture
+def omdb(monkeypatch):
+    """
+    Serves OMDb requests from OMDB_CATALOG instead of the network and
+    returns the list of requested titles. "slow" times out and "limited"
+    gets OMDb's rate limit error.
+    """
+    requested = []
+
+    def fake_get(url, params, timeout):
+        requested.append(params["t"])
+        if params["t"] == "slow":
+            raise requests.exceptions.Timeout("timed out")
+        if params["t"] == "limited":
+            return FakeResponse(
+                {"Response": "False", "Error": "Request limit reached!"}
+                )
+        return FakeResponse(OMDB_CATALOG.get(
+            params["t"],
+            {"Response": "False", "Error": "Movie not found!"}
+            ))
+
+    monkeypatch.setattr(movie_app._SESSION, "get", fake_get)
+    movie_app._request_omdb.cache_clear()
+    yield requested
+    movie_app._request_omdb.cache_clear()
+
+
+@pytest.mark.parametrize("movies, expected", [
+    (
+        {
+            "Alien": movie(1979, 8.5), "Cats": movie(2019, 2.8),
+            "Heat": movie(1995, 8.5), "Jaws": movie(1975, 2.8),
+            "Up": movie(2009, 8.3)
+            },
+        [
+            "Average rating: 6.2", "Median rating: 8.3",
+            "Best movie(s): Alien, Heat, 8.5",
+            "Worst movie(s): Cats, Jaws, 2.8"
+            ]
+        ),
+    (
+        {
+            "Up": movie(2009, 8.3), "Cats": movie(2019, 2.8),
+            "Alien": movie(1979, 8.5), "Dune": movie(2021, 8.0)
+            },
+        [
+            "Average rating: 6.9", "Median rating: 8.2",
+            "Best movie(s): Alien, 8.5",
+            "Worst movie(s): Cats, 2.8"
+            ]
+        )
+    ])
+def test_movie_stats_ties_and_median(tmp_path, capsys, movies, expected):
+    make_app(tmp_path, movies)._command_movie_stats()
+    assert capsys.readouterr().out.split("\n")[1:5] == expected
+
+
+def test_split_template_fills_every_title(tmp_path):
+    app = make_app(tmp_path, {})
+    head, tail = app._split_template(
+        "<title>__TEMPLATE_TITLE__</title><ul>__TEMPLATE_MOVIE_GRID__</ul>"
+        "<h1>__TEMPLATE_TITLE__</h1>"
+        )
+    assert head == "<title>My Movie App</title><ul>"
+    assert tail == "</ul><h1>My Movie App</h1>"
+
+
+def test_non_numeric_fields_parse_as_zero(tmp_path, capsys):
+    app = make_app(tmp_path, {
+        "Alien": {"year": "N/A", "rating": "unrated", "poster": ""},
+        "Heat": {"year": 1995, "rating": None, "poster": ""}
+        })
+    columns = app._get_movie_columns()
+    assert columns.years == [0, 1995]
+    assert columns.ratings == [0.0, 0.0]
+    app._command_movie_stats()
+    assert "Average rating: 0.0" in capsys.readouterr().out
+
+
+def test_bulk_add_movies(tmp_path, omdb, monkeypatch):
+    app = make_app(tmp_path, {"Alien": movie(1979, 8.5)})
+    feed_input(monkeypatch, "Jaws", "alien", "Nothing", "HEAT", "jaws", "")
+    app._command_bulk_add_movies()
+    # Existing titles are skipped before any request is made, and every
+    # other title is requested once
+    assert sorted(omdb) == ["heat", "jaws", "nothing"]
+    assert app._storage.list_movies() == {
+        "Alien": movie(1979, 8.5),
+        "Jaws": {"year": 1975, "rating": 8.1, "poster": "jaws.jpg"},
+        "Heat": {"year": 1995, "rating": 8.3, "poster": "heat.jpg"}
+        }
+
+
+@pytest.mark.parametrize("answers, shown", [
+    (("n",), 50),
+    (("y", "n"), 100),
+    (("y", "y"), 120)
+    ])
+def test_sorted_by_rating_pages(tmp_path, capsys, monkeypatch, answers, shown):
+    movies = {f"Movie {i:03d}": movie(2000, i / 20) for i in range(120)}
+    app = make_app(tmp_path, movies)
+    feed_input(monkeypatch, *answers)
+    app._command_sorted_by_rating()
+    out = capsys.readouterr().out
+    lines = [line for line in out.splitlines() if line.startswith("Movie ")]
+    # Pages continue where the previous one stopped, highest rating first
+    assert lines == [
+        f"Movie {i:03d} (2000): {i / 20}"
+        for i in range(119, 119 - shown, -1)
+        ]
+    if shown < len(movies):
+        assert f"Showing the top {shown} of 120 movies." in out
+
+
+def test_title_commands_do_not_parse_numbers(tmp_path, capsys, monkeypatch):
+    app = make_app(tmp_path, {
+        "Alien": {"year": "N/A", "rating": "unrated", "poster": ""}
+        })
+    feed_input(monkeypatch, "ali")
+    app._command_search_movie()
+    app._command_random_movie()
+    out = capsys.readouterr().out
+    assert "Alien" in out
+    assert "Your movie for tonight: Alien" in out
+    # Only the title columns were built
+    assert app._movie_columns is None
+
+
+def test_find_movie_key_with_non_numeric_fields(tmp_path):
+    app = make_app(tmp_path, {
+        "Alien": {"year": "N/A", "rating": "unrated", "poster": ""},
+        "Heat": movie(1995, 8.3)
+        })
+    assert app._find_movie_key("aLIEN") == "Alien"
+    assert app._find_movie_key("HEAT") == "Heat"
+    assert app._find_movie_key("Jaws") is None
+    assert app._movie_columns is None
+
+
+def test_update_movie_with_non_numeric_rating(tmp_path, capsys, monkeypatch):
+    app = make_app(tmp_path, {
+        "Alien": {"year": "N/A", "rating": "unrated", "poster": ""}
+        })
+    feed_input(monkeypatch, "alien", "8.5")
+    app._command_update_movie()
+    assert app._storage.list_movies()["Alien"]["rating"] == 8.5
+    feed_input(monkeypatch, "alien", "8.5")
+    app._command_update_movie()
+    assert 'Movie "alien" already has rating 8.5.' in capsys.readouterr().out
+
+
+FILTER_MOVIES = {
+    "Titanic": movie(1997, 7.9), "alien": movie(1979, 8.5),
+    "Heat": movie(1995, 8.5), "Cats": movie(2019, 2.8),
+    "Up": movie(2009, 8.3), "Jaws": movie(1975, 8.1),
+    "Dune": movie(2021, 8.0), "Big": movie(1988, 7.3)
+    }
+
+
+@pytest.mark.parametrize("answers, expected", [
+    (("", "", ""), sorted(FILTER_MOVIES, key=str.casefold)),
+    (("8", "", ""), ["alien", "Dune", "Heat", "Jaws", "Up"]),
+    (("", "1988", "2009"), ["Big", "Heat", "Titanic", "Up"]),
+    (("8.1", "1975", "1995"), ["alien", "Heat", "Jaws"]),
+    (("", "2022", ""), []),
+    (("", "", "1974"), [])
+    ])
+def test_filter_movies(tmp_path, capsys, monkeypatch, answers, expected):
+    app = make_app(tmp_path, FILTER_MOVIES)
+    feed_input(monkeypatch, *answers)
+    app._command_filter_movies()
+    out = capsys.readouterr().out
+    titles = [line.split(" (")[0] for line in out.splitlines() if " (" in line]
+    assert titles == expected
+    if not expected:
+        assert "No movies found matching criteria." in out
+
+
+def test_bulk_add_reports_failed_requests_once(
+        tmp_path, capsys, omdb, monkeypatch
+        ):
+    app = make_app(tmp_path, {})
+    feed_input(monkeypatch, "Slow", "Jaws", "")
+    app._command_bulk_add_movies()
+    out = capsys.readouterr().out
+    # The failed title is reported from the prefetch, not requested again
+    assert sorted(omdb) == ["jaws", "slow"]
+    assert "Error: Request timed out. Please try again." in out
+    assert 'Could not fetch movie data for "Slow"' in out
+    assert list(app._storage.list_movies()) == ["Jaws"]
+
+
+def test_bulk_add_saves_with_one_write(tmp_path, omdb, monkeypatch):
+    app = make_app(tmp_path, {})
+    batches = []
+    monkeypatch.setattr(app._storage, "add_movie", None)
+    monkeypatch.setattr(app._storage, "add_movies", batches.append)
+    feed_input(monkeypatch, "Jaws", "Heat", "")
+    app._command_bulk_add_movies()
+    assert batches == [[
+        ("Jaws", 1975, 8.1, "jaws.jpg"),
+        ("Heat", 1995, 8.3, "heat.jpg")
+        ]]
+
+
+@pytest.mark.parametrize("template", [
+    "<ul></ul>",
+    "__TEMPLATE_MOVIE_GRID__<hr>__TEMPLATE_MOVIE_GRID__"
+    ])
+def test_split_template_needs_one_grid_placeholder(tmp_path, template):
+    app = make_app(tmp_path, {})
+    with pytest.raises(ValueError):
+        app._split_template(template)
+
+
+def test_omdb_errors_are_not_cached(tmp_path, capsys, omdb):
+    app = make_app(tmp_path, {})
+    assert app._fetch_movie_from_api("Limited") is None
+    assert app._fetch_movie_from_api("Limited") is None
+    assert "Error from movie database: Request limit reached!" in (
+        capsys.readouterr().out
+        )
+    # Only an unknown title is cached; the rate limit is asked again
+    assert app._fetch_movie_from_api("Nothing") is None
+    assert app._fetch_movie_from_api("Nothing") is None
+    assert omdb == ["limited", "limited", "nothing"]
@@ -0,0 +1,126 @@
+"""
+Tests for the CSV storage implementation.
+"""
+
+import csv
+
+import pytest
+
+from storage import StorageCsv
+
+
+def write_rows(path, rows) -> None:
+    """
+    Writes raw CSV rows, header first, to path.
+    """
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        csv.writer(file).writerows(rows)
+
+
+def read_rows(path) -> list:
+    """
+    Returns the raw CSV rows of path, header first.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        return list(csv.reader(file))
+
+
+@pytest.fixture
+def reordered_csv(tmp_path):
+    """
+    Returns a CSV file whose columns are not in FIELDNAMES order.
+    """
+    path = tmp_path / "movies.csv"
+    write_rows(path, [
+        ["rating", "poster", "title", "year"],
+        ["8.5", "alien.jpg", "Alien", "1979"],
+        ["7.9", "titanic.jpg", "Titanic", "1997"]
+        ])
+    return path
+
+
+def test_add_movie_with_reordered_header(reordered_csv):
+    storage = StorageCsv(str(reordered_csv))
+    storage.add_movie("Heat", 1995, 8.3, "heat.jpg")
+    assert read_rows(reordered_csv)[-1] == ["8.3", "heat.jpg", "Heat", "1995"]
+    assert storage.list_movies()["Heat"] == {
+        "year": 1995, "rating": 8.3, "poster": "heat.jpg"
+        }
+
+
+def test_update_movie_with_reordered_header(reordered_csv):
+    storage = StorageCsv(str(reordered_csv))
+    storage.update_movie("Alien", 9.0)
+    assert read_rows(reordered_csv) == [
+        ["rating", "poster", "title", "year"],
+        ["9.0", "alien.jpg", "Alien", "1979"],
+        ["7.9", "titanic.jpg", "Titanic", "1997"]
+        ]
+
+
+def test_delete_movie_with_reordered_header(reordered_csv):
+    storage = StorageCsv(str(reordered_csv))
+    storage.delete_movie("Alien")
+    assert read_rows(reordered_csv) == [
+        ["rating", "poster", "title", "year"],
+        ["7.9", "titanic.jpg", "Titanic", "1997"]
+        ]
+
+
+def test_rewrite_pads_short_rows_and_skips_blank_lines(tmp_path):
+    path = tmp_path / "movies.csv"
+    write_rows(path, [
+        ["title", "year", "rating", "poster"],
+        ["Alien", "1979"],
+        [],
+        ["Titanic", "1997", "7.9", "titanic.jpg"]
+        ])
+    storage = StorageCsv(str(path))
+    storage.update_movie("Alien", 8.5)
+    storage.delete_movie("Titanic")
+    assert read_rows(path) == [
+        ["title", "year", "rating", "poster"],
+        ["Alien", "1979", "8.5", ""]
+        ]
+
+
+def test_rewrite_without_title_column_reports_error(tmp_path, capsys):
+    path = tmp_path / "movies.csv"
+    write_rows(path, [["name", "year"], ["Alien", "1979"]])
+    StorageCsv(str(path)).delete_movie("Alien")
+    assert "Error deleting movie from CSV" in capsys.readouterr().out
+    assert read_rows(path) == [["name", "year"], ["Alien", "1979"]]
+
+
+def test_list_movies_pads_short_rows(tmp_path):
+    path = tmp_path / "movies.csv"
+    write_rows(path, [
+        ["rating", "poster", "title", "year"],
+        ["8.5", "alien.jpg", "Alien"],
+        [],
+        ["7.9", "", "Titanic", "1997"]
+        ])
+    assert StorageCsv(str(path)).list_movies() == {
+        "Alien": {"year": 0, "rating": 8.5, "poster": "alien.jpg"},
+        "Titanic": {"year": 1997, "rating": 7.9, "poster": ""}
+        }
+
+
+def test_add_movies_writes_every_row(tmp_path):
+    path = tmp_path / "movies.csv"
+    storage = StorageCsv(str(path))
+    storage.add_movies([
+        ("Alien", 1979, 8.5, "alien.jpg"),
+        ("Heat", 1995, 8.3, "heat.jpg")
+        ])
+    storage.add_movies([
+        ("Jaws", 1975, 8.1, "jaws.jpg"),
+        ("Up", 2009, 8.3, "up.jpg")
+        ])
+    assert read_rows(path) == [
+        ["title", "year", "rating", "poster"],
+        ["Alien", "1979", "8.5", "alien.jpg"],
+        ["Heat", "1995", "8.3", "heat.jpg"],
+        ["Jaws", "1975", "8.1", "jaws.jpg"],
+        ["Up", "2009", "8.3", "up.jpg"]
+        ]
@@ -0,0 +1,166 @@
+"""
+Tests for the JSON storage implementation and its journal.
+"""
+
+import json
+
+from storage import StorageJson
+from storage import storage_json
+
+ALIEN = {"rating": 8.5, "year": 1979, "poster": "alien.jpg"}
+ALIEN_RECORD = (
+    b'{"op": "add", "title": "Alien", "movie": {"rating": 8.5, '
+    b'"year": 1979, "poster": "alien.jpg"}}\n'
+    )
+
+
+def read_json(path) -> dict:
+    """
+    Returns the parsed contents of a JSON file.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def write_journal(path, lines) -> None:
+    """
+    Writes raw journal lines next to the JSON file at path.
+    """
+    with open(str(path) + ".journal", "wb") as journal:
+        journal.write(b"".join(lines))
+
+
+def test_changes_are_journaled_and_replayed(tmp_path):
+    path = tmp_path / "movies.json"
+    storage = StorageJson(str(path))
+    storage.add_movie("Alien", 1979, 8.5, "alien.jpg")
+    storage.add_movie("Heat", 1995, 8.3, "heat.jpg")
+    storage.update_movie("Alien", 9.0)
+    storage.delete_movie("Heat")
+    journal_path = tmp_path / "movies.json.journal"
+    assert journal_path.exists()
+    # A new session replays the journal and folds it into the JSON file
+    movies = StorageJson(str(path)).list_movies()
+    assert movies == {"Alien": dict(ALIEN, rating=9.0)}
+    assert read_json(path) == movies
+    assert not journal_path.exists()
+
+
+def test_add_movies_records_every_movie(tmp_path):
+    path = tmp_path / "movies.json"
+    storage = StorageJson(str(path))
+    storage.add_movies([
+        ("Alien", 1979, 8.5, "alien.jpg"),
+        ("Heat", 1995, 8.3, "heat.jpg")
+        ])
+    # One write appends one journal line per movie
+    journal_path = tmp_path / "movies.json.journal"
+    assert len(journal_path.read_bytes().splitlines()) == 2
+    expected = {
+        "Alien": ALIEN,
+        "Heat": {"rating": 8.3, "year": 1995, "poster": "heat.jpg"}
+        }
+    assert storage.list_movies() == expected
+    assert StorageJson(str(path)).list_movies() == expected
+
+
+def test_journal_is_compacted_past_size_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_json, "JOURNAL_COMPACT_SIZE", 1)
+    path = tmp_path / "movies.json"
+    storage = StorageJson(str(path))
+    storage.add_movie("Alien", 1979, 8.5, "alien.jpg")
+    assert read_json(path) == {"Alien": ALIEN}
+    assert not (tmp_path / "movies.json.journal").exists()
+
+
+def test_compact_journal_writes_json_file(tmp_path):
+    path = tmp_path / "movies.json"
+    storage = StorageJson(str(path))
+    storage.add_movie("Alien", 1979, 8.5, "alien.jpg")
+    storage._compact_journal()
+    assert read_json(path) == {"Alien": ALIEN}
+    assert not (tmp_path / "movies.json.journal").exists()
+
+
+def test_replay_drops_torn_last_line(tmp_path, capsys):
+    path = tmp_path / "movies.json"
+    path.write_text("{}", encoding="utf-8")
+    write_journal(path, [ALIEN_RECORD, b'{"op": "delete", "tit'])
+    assert StorageJson(str(path)).list_movies() == {"Alien": ALIEN}
+    assert capsys.readouterr().out == ""
+    assert read_json(path) == {"Alien": ALIEN}
+    assert not (tmp_path / "movies.json.journal").exists()
+
+
+def test_replay_keeps_journal_with_malformed_record(tmp_path, capsys):
+    path = tmp_path / "movies.json"
+    path.write_text("{}", encoding="utf-8")
+    lines = [
+        ALIEN_RECORD,
+        b'{"op": "update", "rating": 1.0}\n',
+        b'{"op": "delete", "title": "Alien"}\n'
+        ]
+    write_journal(path, lines)
+    assert StorageJson(str(path)).list_movies() == {"Alien": ALIEN}
+    assert "Could not replay line 2" in capsys.readouterr().out
+    # The records before the damaged line are saved and the journal is
+    # kept aside with the records after it
+    assert read_json(path) == {"Alien": ALIEN}
+    json_name, journal_name = sorted(p.name for p in tmp_path.iterdir())
+    assert json_name == "movies.json"
+    assert journal_name.startswith("movies.json.journal.corrupt.")
+    assert (tmp_path / journal_name).read_bytes() == b"".join(lines)
+
+
+def test_corrupt_file_is_moved_aside(tmp_path, capsys):
+    path = tmp_path / "movies.json"
+    path.write_text("{not json", encoding="utf-8")
+    storage = StorageJson(str(path))
+    assert storage.list_movies() == {}
+    assert "File may be corrupted" in capsys.readouterr().out
+    (corrupt_path,) = tmp_path.iterdir()
+    assert corrupt_path.name.startswith("movies.json.corrupt.")
+    assert corrupt_path.read_text(encoding="utf-8") == "{not json"
+    # The next save starts a new file instead of overwriting the old one
+    storage.add_movie("Alien", 1979, 8.5, "alien.jpg")
+    storage._compact_journal()
+    assert read_json(path) == {"Alien": ALIEN}
+    assert corrupt_path.read_text(encoding="utf-8") == "{not json"
+
+
+def test_corrupt_file_is_moved_aside_with_its_journal(tmp_path):
+    path = tmp_path / "movies.json"
+    path.write_text("{not json", encoding="utf-8")
+    write_journal(path, [b'{"op": "delete", "title": "Alien"}\n'])
+    storage = StorageJson(str(path))
+    assert storage.list_movies() == {}
+    corrupt_name, journal_name = sorted(p.name for p in tmp_path.iterdir())
+    assert corrupt_name.startswith("movies.json.corrupt.")
+    assert journal_name == "movies.json.journal" + corrupt_name[11:]
+    # Only changes made after the quarantine are persisted
+    storage.add_movie("Alien", 1979, 8.5, "alien.jpg")
+    storage._compact_journal()
+    assert read_json(path) == {"Alien": ALIEN}
+
+
+def test_file_written_by_stdlib_json_is_not_quarantined(tmp_path):
+    path = tmp_path / "movies.json"
+    path.write_text(
+        '{"Alien": {"year": 123456789012345678901, "rating": NaN, '
+        '"poster": ""}}',
+        encoding="utf-8"
+        )
+    movies = StorageJson(str(path)).list_movies()
+    assert movies["Alien"]["year"] == 123456789012345678901
+    assert movies["Alien"]["rating"] != movies["Alien"]["rating"]
+    assert [p.name for p in tmp_path.iterdir()] == ["movies.json"]
+
+
+def test_saved_file_keeps_four_space_indent(tmp_path):
+    path = tmp_path / "movies.json"
+    storage = StorageJson(str(path))
+    storage.add_movie("Amélie", 2001, 8.3, "")
+    storage._compact_journal()
+    assert path.read_text(encoding="utf-8") == json.dumps(
+        {"Amélie": {"rating": 8.3, "year": 2001, "poster": ""}}, indent=4
+        )